@@ -1,5 +1,4 @@
 import os
-import pandas as pd
 import logging
 from typing import List, Dict, Tuple, Optional
 
@@ -31,8 +30,12 @@ class KarnatakaLocationValidator:
             'raichur': ['raichur', 'raychur']
         }
         
-    def _load_karnataka_cities(self) -> pd.DataFrame:
+    def _load_karnataka_cities(self) -> "pd.DataFrame":
         """Load Karnataka cities from CSV file"""
+        # Imported here so workers that never construct the validator
+        # (e.g. symptom-check-only processes) skip the pandas startup cost
+        import pandas as pd
+
         try:
             if os.path.exists(self.cities_file):
                 df = pd.read_csv(self.cities_file)
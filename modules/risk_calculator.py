@@ -1,6 +1,68 @@
+import functools
 import logging
 from datetime import datetime
 
+# Static response parts per risk tier, built once at import so every
+# assessment splices the same immutable structures instead of rebuilding
+# the lists on each call. Ordered high-to-low by score threshold.
+_RISK_TIERS = (
+    (12, {
+        'risk_level': "Very High",
+        'risk_color': "danger",
+        'urgency': "Immediate action required",
+        'priority_actions': [
+            "🚨 URGENT: Remove all stagnant water immediately",
+            "Apply mosquito control measures today",
+            "Use personal protection consistently",
+            "Consider professional pest control"
+        ]
+    }),
+    (8, {
+        'risk_level': "High",
+        'risk_color': "warning",
+        'urgency': "Take action within 24 hours",
+        'priority_actions': [
+            "⚠️ Remove stagnant water sources",
+            "Increase mosquito control measures",
+            "Use repellents and protective clothing",
+            "Improve drainage around property"
+        ]
+    }),
+    (5, {
+        'risk_level': "Medium",
+        'risk_color': "info",
+        'urgency': "Take preventive action this week",
+        'priority_actions': [
+            "ℹ️ Weekly inspection for breeding sites",
+            "Cover water storage containers",
+            "Use mosquito nets and repellents",
+            "Maintain clean surroundings"
+        ]
+    }),
+    (2, {
+        'risk_level': "Low-Medium",
+        'risk_color': "primary",
+        'urgency': "Continue preventive measures",
+        'priority_actions': [
+            "✓ Regular cleaning and maintenance",
+            "Monitor for mosquito activity",
+            "Keep water containers covered",
+            "Maintain good sanitation"
+        ]
+    }),
+    (0, {
+        'risk_level': "Low",
+        'risk_color': "success",
+        'urgency': "Maintain current practices",
+        'priority_actions': [
+            "✅ Continue good practices",
+            "Stay vigilant for changes",
+            "Regular property maintenance",
+            "Community awareness"
+        ]
+    })
+)
+
 class RiskCalculator:
     def __init__(self):
         # Environmental and behavioral risk factors with weights
@@ -46,107 +108,77 @@ class RiskCalculator:
                 'description': 'Irregular garbage collection'
             }
         }
-        
+
+        # Stable bit per factor so any combination packs into one small integer
+        # key - lets repeated assessments hit the lru_cache below
+        self._factor_bits = {name: 1 << i for i, name in enumerate(self.risk_factors)}
+
     def calculate_risk(self, factors):
         """Calculate dengue risk score based on environmental factors"""
         try:
-            total_score = 0
-            present_factors = []
-            
-            # Calculate total risk score
-            for factor, present in factors.items():
-                if present and factor in self.risk_factors:
-                    weight = self.risk_factors[factor]['weight']
-                    description = self.risk_factors[factor]['description']
-                    total_score += weight
-                    present_factors.append({
-                        'factor': factor,
-                        'description': description,
-                        'weight': weight
-                    })
-            
-            # Determine risk level based on score
-            max_possible_score = sum(factor['weight'] for factor in self.risk_factors.values())
-            risk_percentage = (total_score / max_possible_score) * 100
-            
-            if total_score >= 12:
-                risk_level = "Very High"
-                risk_color = "danger"
-                urgency = "Immediate action required"
-                priority_actions = [
-                    "🚨 URGENT: Remove all stagnant water immediately",
-                    "Apply mosquito control measures today",
-                    "Use personal protection consistently",
-                    "Consider professional pest control"
-                ]
-            elif total_score >= 8:
-                risk_level = "High"
-                risk_color = "warning"
-                urgency = "Take action within 24 hours"
-                priority_actions = [
-                    "⚠️ Remove stagnant water sources",
-                    "Increase mosquito control measures",
-                    "Use repellents and protective clothing",
-                    "Improve drainage around property"
-                ]
-            elif total_score >= 5:
-                risk_level = "Medium"
-                risk_color = "info"
-                urgency = "Take preventive action this week"
-                priority_actions = [
-                    "ℹ️ Weekly inspection for breeding sites",
-                    "Cover water storage containers",
-                    "Use mosquito nets and repellents",
-                    "Maintain clean surroundings"
-                ]
-            elif total_score >= 2:
-                risk_level = "Low-Medium"
-                risk_color = "primary"
-                urgency = "Continue preventive measures"
-                priority_actions = [
-                    "✓ Regular cleaning and maintenance",
-                    "Monitor for mosquito activity",
-                    "Keep water containers covered",
-                    "Maintain good sanitation"
-                ]
+            # Empty/all-False forms go straight to the cached "Low" tier
+            # without scanning the factor table
+            if not any(factors.values()):
+                key = 0
             else:
-                risk_level = "Low"
-                risk_color = "success"
-                urgency = "Maintain current practices"
-                priority_actions = [
-                    "✅ Continue good practices",
-                    "Stay vigilant for changes",
-                    "Regular property maintenance",
-                    "Community awareness"
-                ]
-            
-            # Generate detailed recommendations
-            detailed_recommendations = self._generate_detailed_recommendations(present_factors, risk_level)
-            
-            # Risk factor analysis
-            high_risk_factors = [f for f in present_factors if f['weight'] >= 3]
-            medium_risk_factors = [f for f in present_factors if f['weight'] == 2]
-            low_risk_factors = [f for f in present_factors if f['weight'] == 1]
-            
-            return {
-                'risk_level': risk_level,
-                'risk_color': risk_color,
-                'total_score': total_score,
-                'max_score': max_possible_score,
-                'risk_percentage': round(risk_percentage, 1),
-                'urgency': urgency,
-                'present_factors': present_factors,
-                'high_risk_factors': high_risk_factors,
-                'medium_risk_factors': medium_risk_factors,
-                'low_risk_factors': low_risk_factors,
-                'priority_actions': priority_actions,
-                'detailed_recommendations': detailed_recommendations,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
+                # Pack the boolean form inputs into a bitmask; identical
+                # submissions become a single cached lookup
+                key = sum(bit for name, bit in self._factor_bits.items() if factors.get(name))
+            result = dict(self._calculate_risk_cached(key))
+            result['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            return result
+
         except Exception as e:
             logging.error(f"Risk calculation error: {str(e)}")
             raise e
+
+    @functools.lru_cache(maxsize=1024)
+    def _calculate_risk_cached(self, key):
+        """Run the full scoring pipeline for a factor bitmask (cached)"""
+        total_score = 0
+        present_factors = []
+
+        # Calculate total risk score
+        for factor, bit in self._factor_bits.items():
+            if key & bit:
+                weight = self.risk_factors[factor]['weight']
+                description = self.risk_factors[factor]['description']
+                total_score += weight
+                present_factors.append({
+                    'factor': factor,
+                    'description': description,
+                    'weight': weight
+                })
+
+        # Determine risk level based on score
+        max_possible_score = sum(factor['weight'] for factor in self.risk_factors.values())
+        risk_percentage = (total_score / max_possible_score) * 100
+        
+        # Pick the pre-built tier table entry for this score
+        for threshold, tier in _RISK_TIERS:
+            if total_score >= threshold:
+                break
+
+        # Generate detailed recommendations
+        detailed_recommendations = self._generate_detailed_recommendations(present_factors, tier['risk_level'])
+        
+        # Risk factor analysis
+        high_risk_factors = [f for f in present_factors if f['weight'] >= 3]
+        medium_risk_factors = [f for f in present_factors if f['weight'] == 2]
+        low_risk_factors = [f for f in present_factors if f['weight'] == 1]
+        
+        return {
+            **tier,
+            'total_score': total_score,
+            'max_score': max_possible_score,
+            'risk_percentage': round(risk_percentage, 1),
+            'present_factors': present_factors,
+            'high_risk_factors': high_risk_factors,
+            'medium_risk_factors': medium_risk_factors,
+            'low_risk_factors': low_risk_factors,
+            'detailed_recommendations': detailed_recommendations
+        }
+
     
     def _generate_detailed_recommendations(self, present_factors, risk_level):
         """Generate detailed recommendations based on identified factors"""
@@ -1,6 +1,63 @@
+import functools
 import logging
 from datetime import datetime
 
+# WHO warning signs that require immediate medical care
+_WARNING_SIGNS = frozenset({'bleeding', 'vomiting'})
+
+# Static response parts per risk tier, built once at import so every
+# assessment splices the same immutable structures instead of rebuilding
+# the lists on each call
+_SYMPTOM_TIERS = {
+    'High': {
+        'risk_level': "High",
+        'risk_color': "danger",
+        'urgency': "Immediate medical attention required",
+        'recommendations': [
+            "🚨 SEEK IMMEDIATE MEDICAL ATTENTION",
+            "Go to the nearest hospital or healthcare center",
+            "Do not take aspirin or ibuprofen",
+            "Monitor for signs of shock or severe bleeding",
+            "Stay hydrated with oral rehydration solution"
+        ]
+    },
+    'Medium': {
+        'risk_level': "Medium",
+        'risk_color': "warning",
+        'urgency': "Medical consultation recommended",
+        'recommendations': [
+            "Consult a healthcare provider within 24 hours",
+            "Monitor symptoms closely",
+            "Rest and maintain fluid intake",
+            "Avoid aspirin and NSAIDs",
+            "Use paracetamol for fever if needed"
+        ]
+    },
+    'Low-Medium': {
+        'risk_level': "Low-Medium",
+        'risk_color': "info",
+        'urgency': "Monitor symptoms and consider medical advice",
+        'recommendations': [
+            "Monitor symptoms for 24-48 hours",
+            "Rest and stay hydrated",
+            "Avoid mosquito bites",
+            "Seek medical advice if symptoms worsen",
+            "Maintain fever diary if present"
+        ]
+    },
+    'Low': {
+        'risk_level': "Low",
+        'risk_color': "success",
+        'urgency': "Continue preventive measures",
+        'recommendations': [
+            "Continue dengue prevention measures",
+            "Stay alert for symptom development",
+            "Maintain good hygiene",
+            "Avoid mosquito breeding sites"
+        ]
+    }
+}
+
 class SymptomChecker:
     def __init__(self):
         # WHO-based symptom weights for dengue
@@ -14,90 +71,71 @@ class SymptomChecker:
             'vomiting': 2,       # More serious
             'bleeding': 4        # Warning sign
         }
-        
+
+        # Stable bit per symptom so any combination packs into one small
+        # integer key - lets repeated checks hit the lru_cache below
+        self._symptom_bits = {name: 1 << i for i, name in enumerate(self.symptom_weights)}
+
     def check_symptoms(self, symptoms):
         """Assess dengue risk based on symptoms according to WHO guidelines"""
         try:
-            total_score = 0
-            present_symptoms = []
-            warning_signs = []
-            
-            # Calculate symptom score
-            for symptom, present in symptoms.items():
-                if present:
-                    total_score += self.symptom_weights.get(symptom, 0)
-                    present_symptoms.append(symptom.replace('_', ' ').title())
-                    
-                    # Check for warning signs
-                    if symptom in ['bleeding', 'vomiting'] and present:
-                        warning_signs.append(symptom.replace('_', ' ').title())
-            
-            # Determine risk level based on WHO criteria
-            if total_score >= 8 or 'bleeding' in [s.lower() for s in present_symptoms]:
-                risk_level = "High"
-                risk_color = "danger"
-                urgency = "Immediate medical attention required"
-                recommendations = [
-                    "🚨 SEEK IMMEDIATE MEDICAL ATTENTION",
-                    "Go to the nearest hospital or healthcare center",
-                    "Do not take aspirin or ibuprofen",
-                    "Monitor for signs of shock or severe bleeding",
-                    "Stay hydrated with oral rehydration solution"
-                ]
-            elif total_score >= 5 or len(present_symptoms) >= 3:
-                risk_level = "Medium"
-                risk_color = "warning"
-                urgency = "Medical consultation recommended"
-                recommendations = [
-                    "Consult a healthcare provider within 24 hours",
-                    "Monitor symptoms closely",
-                    "Rest and maintain fluid intake",
-                    "Avoid aspirin and NSAIDs",
-                    "Use paracetamol for fever if needed"
-                ]
-            elif total_score >= 2:
-                risk_level = "Low-Medium"
-                risk_color = "info"
-                urgency = "Monitor symptoms and consider medical advice"
-                recommendations = [
-                    "Monitor symptoms for 24-48 hours",
-                    "Rest and stay hydrated",
-                    "Avoid mosquito bites",
-                    "Seek medical advice if symptoms worsen",
-                    "Maintain fever diary if present"
-                ]
+            # Empty/all-False forms go straight to the cached "Low" tier
+            # without scanning the symptom table
+            if not any(symptoms.values()):
+                key = 0
             else:
-                risk_level = "Low"
-                risk_color = "success"
-                urgency = "Continue preventive measures"
-                recommendations = [
-                    "Continue dengue prevention measures",
-                    "Stay alert for symptom development",
-                    "Maintain good hygiene",
-                    "Avoid mosquito breeding sites"
-                ]
-            
-            # Generate WHO-based assessment
-            who_notes = []
-            if 'fever' in [s.lower() for s in present_symptoms]:
-                who_notes.append("Fever is the most common symptom of dengue")
-            if any(symptom in ['joint_pain', 'muscle_pain'] for symptom in [s.lower().replace(' ', '_') for s in present_symptoms]):
-                who_notes.append("Body aches are characteristic of dengue fever")
-            if warning_signs:
-                who_notes.append("⚠️ Warning signs detected - immediate medical care needed")
-            
-            return {
-                'risk_level': risk_level,
-                'risk_color': risk_color,
-                'total_score': total_score,
-                'present_symptoms': present_symptoms,
-                'warning_signs': warning_signs,
-                'urgency': urgency,
-                'recommendations': recommendations,
-                'who_notes': who_notes,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-            
+                # Pack the boolean form inputs into a bitmask; identical
+                # submissions become a single cached lookup
+                key = sum(bit for name, bit in self._symptom_bits.items() if symptoms.get(name))
+            result = dict(self._check_symptoms_cached(key))
+            result['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            return result
+
         except Exception as e:
             logging.error(f"Symptom check error: {str(e)}")
             raise e
+
+    @functools.lru_cache(maxsize=1024)
+    def _check_symptoms_cached(self, key):
+        """Run the full WHO assessment for a symptom bitmask (cached)"""
+        total_score = 0
+        present_symptoms = []
+        warning_signs = []
+
+        # Calculate symptom score
+        for symptom, bit in self._symptom_bits.items():
+            if key & bit:
+                total_score += self.symptom_weights.get(symptom, 0)
+                present_symptoms.append(symptom.replace('_', ' ').title())
+
+                # Check for warning signs
+                if symptom in _WARNING_SIGNS:
+                    warning_signs.append(symptom.replace('_', ' ').title())
+
+        # Determine risk level based on WHO criteria and splice in the
+        # pre-built tier table entry
+        if total_score >= 8 or 'bleeding' in [s.lower() for s in present_symptoms]:
+            tier = _SYMPTOM_TIERS['High']
+        elif total_score >= 5 or len(present_symptoms) >= 3:
+            tier = _SYMPTOM_TIERS['Medium']
+        elif total_score >= 2:
+            tier = _SYMPTOM_TIERS['Low-Medium']
+        else:
+            tier = _SYMPTOM_TIERS['Low']
+
+        # Generate WHO-based assessment
+        who_notes = []
+        if 'fever' in [s.lower() for s in present_symptoms]:
+            who_notes.append("Fever is the most common symptom of dengue")
+        if any(symptom in ['joint_pain', 'muscle_pain'] for symptom in [s.lower().replace(' ', '_') for s in present_symptoms]):
+            who_notes.append("Body aches are characteristic of dengue fever")
+        if warning_signs:
+            who_notes.append("⚠️ Warning signs detected - immediate medical care needed")
+        
+        return {
+            **tier,
+            'total_score': total_score,
+            'present_symptoms': present_symptoms,
+            'warning_signs': warning_signs,
+            'who_notes': who_notes
+        }
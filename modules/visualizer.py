@@ -2,221 +2,517 @@ import pandas as pd
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend for server deployment
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, ImageDraw, ImageFont
 import seaborn as sns
 import numpy as np
-import base64
 import io
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
 
-# Set matplotlib font to prevent font cache issues on server
-plt.rcParams['font.family'] = 'DejaVu Sans'
+try:
+    # SIMD-accelerated drop-in for the stdlib encoder; worthwhile because
+    # every chart response base64-encodes a full image
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
+logger = logging.getLogger(__name__)
+
+# One explicit style update at import instead of plt.style.use per
+# Visualizer instance: style.use re-reads and re-parses the style file
+# every call, and spelling the params out here also replaces the
+# per-axes spine fiddling the chart methods used to repeat.
+plt.rcParams.update({
+    # Fixed font prevents font cache issues on server
+    'font.family': 'DejaVu Sans',
+    # Chunk long line paths so Agg renders dense series faster
+    'agg.path.chunksize': 10000,
+    # The subset of seaborn-v0_8-darkgrid this app actually relies on
+    'axes.grid': True,
+    'grid.alpha': 0.3,
+    'grid.color': '#6b7280',
+    'axes.spines.top': False,
+    'axes.spines.right': False,
+    'axes.edgecolor': '#6b7280',
+    'axes.facecolor': 'white',
+    'figure.facecolor': 'white',
+})
+
+# Only the columns the charts/map actually use, with compact dtypes.
+# Category City/State lets groupby run on integer codes instead of strings.
+_DENGUE_USECOLS = ['Date', 'City', 'State', 'Cases', 'Latitude', 'Longitude']
+_DENGUE_DTYPES = {
+    'Cases': 'int32',
+    'City': 'category',
+    'State': 'category',
+    'Latitude': 'float32',
+    'Longitude': 'float32'
+}
+
+# Schema is validated once at load time so the chart/statistics code can
+# assume these columns exist instead of re-checking on every call
+_REQUIRED_DENGUE = {'Date', 'Cases', 'City', 'State'}
+
+# Shared bar palette for the location chart (matplotlib and lite paths)
+_BAR_COLORS = ('#dc2626', '#ea580c', '#f59e0b', '#eab308', '#84cc16',
+               '#22c55e', '#10b981', '#14b8a6', '#06b6d4', '#0ea5e9')
+
+# Karnataka cities with coordinates (all 12 cities from our dataset), frozen
+# as a tuple of (name, lat, lng) shared by every map request
+_KARNATAKA_CITIES = (
+    ('Bangalore', 12.9716, 77.5946),
+    ('Mysore', 12.2958, 76.6394),
+    ('Hubli', 15.3647, 75.1240),
+    ('Mangalore', 12.9141, 74.8560),
+    ('Belgaum', 15.8497, 74.4977),
+    ('Tumkur', 13.3379, 77.1022),
+    ('Davangere', 14.4644, 75.9218),
+    ('Bellary', 15.1394, 76.9214),
+    ('Bijapur', 16.8302, 75.7100),
+    ('Shimoga', 13.9299, 75.5681),
+    ('Gulbarga', 17.3297, 76.8343),
+    ('Hassan', 13.0033, 76.1004)
+)
+
+def _fast_group_sum(keys, values):
+    """Group-sum via factorize + bincount, skipping pandas' groupby machinery
+
+    For the small fixed key sets here (12 cities, daily dates) the per-call
+    overhead of DataFrame.groupby dwarfs the actual summing; bincount on the
+    factorized codes does the same reduction in two C calls.
+    """
+    codes, uniques = pd.factorize(keys, sort=False)
+    weights = values.to_numpy(dtype=np.float64)
+    if (codes < 0).any():
+        # Drop NaN/NaT keys, matching groupby's behaviour
+        mask = codes >= 0
+        codes, weights = codes[mask], weights[mask]
+    sums = np.bincount(codes, weights=weights)
+    return pd.Series(sums.astype(np.int64), index=uniques, name=values.name)
+
 
 class Visualizer:
     def __init__(self):
         self.dengue_cases_file = 'datasets/dengue_cases.csv'
-        plt.style.use('seaborn-v0_8-darkgrid')
-        
+
+        # Parsed CSVs cached per path, keyed by (mtime, size) so unchanged
+        # files are not re-read and re-parsed on every request
+        self._data_cache = {}
+
+        # Derived aggregations cached against the same key, shared by the
+        # charts, the statistics and the map endpoint
+        self._prepared_cache = None
+
+        # Fully rendered chart payloads cached against the same key, so
+        # repeat visualization requests skip matplotlib entirely
+        self._chart_cache = None
+
+        # Render settings - 90 DPI roughly quarters the pixel count (and the
+        # zlib encode cost) vs the old 150 with no visible loss in the web UI
+        self._dpi = int(os.getenv('VIZ_DPI', '90'))
+        self._fmt = os.getenv('VIZ_FMT', 'png').lower()
+        if self._fmt == 'jpg':
+            self._fmt = 'jpeg'
+        # JPEG encodes the filled/gradient-heavy plots several times faster
+        # and smaller than PNG; the templates read this for the data URI
+        self.image_mime = 'image/jpeg' if self._fmt == 'jpeg' else 'image/png'
+
+        # One reusable Figure per chart type, built lazily and outside
+        # pyplot so no global state is touched; fig.clear() per render
+        # skips the construction/teardown cost of plt.subplots + plt.close
+        self._figures = {}
+
+        # Opt-in Pillow-only renderer for small bar charts; off by
+        # default so the standard matplotlib look is unchanged
+        self._lite = os.getenv('VIZ_LITE', '').lower() in ('1', 'true', 'yes')
+
+        # "No data" images rendered at most once per title, so empty-data
+        # requests skip matplotlib entirely after the first miss
+        self._placeholder_cache = {}
+
     def load_data(self):
         """Load datasets for visualization"""
         try:
             dengue_data = pd.DataFrame()
-            
+
             if os.path.exists(self.dengue_cases_file):
-                dengue_data = pd.read_csv(self.dengue_cases_file)
-                print(f"Loaded dengue data: {len(dengue_data)} rows")
-                print(f"Dengue data columns: {dengue_data.columns.tolist()}")
-                
-                if 'Date' in dengue_data.columns:
-                    dengue_data['Date'] = pd.to_datetime(dengue_data['Date'], errors='coerce')
-                
-                # Ensure we have the required data
-                if len(dengue_data) > 0:
-                    print(f"Date range: {dengue_data['Date'].min()} to {dengue_data['Date'].max()}")
-                    print(f"Total cases: {dengue_data['Cases'].sum()}")
-                    print(f"Cities: {dengue_data['City'].unique()}")
-            
+                st = os.stat(self.dengue_cases_file)
+                cache_key = (st.st_mtime_ns, st.st_size)
+                cached = self._data_cache.get(self.dengue_cases_file)
+                if cached is not None and cached[0] == cache_key:
+                    return cached[1]
+
+                dengue_data = self._read_dengue_frame()
+
+                missing = _REQUIRED_DENGUE.difference(dengue_data.columns)
+                if missing:
+                    raise ValueError(f"Dengue dataset missing columns: {sorted(missing)}")
+
+                # Sort chronologically once at ingestion; the cached frame
+                # is reused by every consumer, and _fast_group_sum emits
+                # keys in first-appearance order, so the daily series comes
+                # out already ordered without a per-chart sort
+                dengue_data.sort_values('Date', kind='stable',
+                                        ignore_index=True, inplace=True)
+
+                logger.debug("Loaded dengue data: %d rows", len(dengue_data))
+
+                # The summary args below each cost a column scan, so only
+                # build them when debug logging is actually on
+                if len(dengue_data) > 0 and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Dengue data columns: %s", dengue_data.columns.tolist())
+                    logger.debug("Date range: %s to %s",
+                                 dengue_data['Date'].min(), dengue_data['Date'].max())
+                    logger.debug("Total cases: %d", dengue_data['Cases'].sum())
+                    logger.debug("Cities: %s", dengue_data['City'].unique())
+
+                # Date parsing happened at fill time, so cache hits skip it
+                self._data_cache[self.dengue_cases_file] = (cache_key, dengue_data)
+
             return dengue_data
         except Exception as e:
-            logging.error(f"Data loading error: {str(e)}")
-            print(f"Error loading data: {str(e)}")
+            logger.error(f"Data loading error: {str(e)}")
             return pd.DataFrame()
     
-    def create_time_series_chart(self, dengue_data):
-        """Create time series chart of dengue cases"""
+    def _read_dengue_frame(self):
+        """Read the dengue dataset, preferring a Parquet sidecar over the CSV
+
+        Parquet skips text parsing entirely, so once the sidecar exists
+        process restarts load the data several times faster. Falls back to
+        plain CSV when pyarrow is unavailable.
+        """
+        parquet_file = self.dengue_cases_file + '.parquet'
         try:
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            print(f"Creating time series chart with {len(dengue_data)} rows")
-            
-            if not dengue_data.empty and 'Date' in dengue_data.columns and 'Cases' in dengue_data.columns:
-                # Group by date and sum cases
-                daily_cases = dengue_data.groupby('Date')['Cases'].sum().reset_index()
-                daily_cases = daily_cases.sort_values('Date')
-                
-                print(f"Daily cases data: {len(daily_cases)} points")
-                print(f"Date range: {daily_cases['Date'].min()} to {daily_cases['Date'].max()}")
-                
-                # Create the plot with vibrant colors
-                ax.plot(daily_cases['Date'], daily_cases['Cases'], 
-                       marker='o', linewidth=3, markersize=6, color='#dc2626', markerfacecolor='#ef4444')
-                ax.fill_between(daily_cases['Date'], daily_cases['Cases'], 
-                              alpha=0.4, color='#ef4444')
-                
-                ax.set_title('Dengue Cases Over Time', fontsize=16, fontweight='bold', color='#1f2937')
-                ax.text(0.5, 0.95, 'Across 12 Karnataka Cities', transform=ax.transAxes, 
-                       ha='center', fontsize=10, style='italic', color='#6b7280')
-                ax.set_xlabel('Date', fontsize=12, fontweight='600')
-                ax.set_ylabel('Number of Cases', fontsize=12, fontweight='600')
-                ax.grid(True, alpha=0.3, color='#6b7280')
-                
-                # Format x-axis
-                plt.xticks(rotation=45)
-                plt.tight_layout()
-                
-                # Add some styling
-                ax.spines['top'].set_visible(False)
-                ax.spines['right'].set_visible(False)
-                ax.spines['left'].set_color('#6b7280')
-                ax.spines['bottom'].set_color('#6b7280')
-            else:
-                print("No valid dengue data for time series chart")
-                ax.text(0.5, 0.5, 'No dengue cases data available\nPlease check data files', 
-                       horizontalalignment='center', verticalalignment='center',
-                       fontsize=14, transform=ax.transAxes, color='#ef4444')
-                ax.set_title('Dengue Cases Over Time', fontsize=16, fontweight='bold')
-            
-            # Convert to base64
+            if (os.path.exists(parquet_file)
+                    and os.path.getmtime(parquet_file) >= os.path.getmtime(self.dengue_cases_file)):
+                dengue_data = pd.read_parquet(parquet_file, columns=_DENGUE_USECOLS)
+                # A sidecar written before the compact schema may carry
+                # int64/object columns; astype with copy=False is a no-op
+                # when the dtypes already match
+                return dengue_data.astype(_DENGUE_DTYPES, copy=False)
+        except Exception as e:
+            logger.warning(f"Parquet cache read failed, using CSV: {str(e)}")
+
+        read_kwargs = dict(usecols=_DENGUE_USECOLS,
+                           dtype=_DENGUE_DTYPES,
+                           parse_dates=['Date'])
+        try:
+            # pyarrow's multithreaded CSV parser is several times faster
+            # than the default C engine on this workload
+            dengue_data = pd.read_csv(self.dengue_cases_file,
+                                      engine='pyarrow', **read_kwargs)
+        except (ImportError, ValueError, TypeError):
+            # pyarrow unavailable (or rejects an option on this pandas
+            # version): the C engine with an explicit format still keeps
+            # the ISO dates on the vectorized path instead of dateutil
+            dengue_data = pd.read_csv(self.dengue_cases_file,
+                                      date_format='%Y-%m-%d', **read_kwargs)
+
+        try:
+            dengue_data.to_parquet(parquet_file)
+        except Exception as e:
+            # pyarrow not installed or read-only filesystem - CSV still works
+            logger.warning(f"Could not write Parquet cache: {str(e)}")
+
+        return dengue_data
+
+    def _prepare(self, dengue_data):
+        """Compute the aggregations shared by charts, statistics and map once"""
+        prepared = {'daily': None, 'city_totals': None, 'by_city': None}
+
+        if not dengue_data.empty:
+            # Input is date-sorted at load, so first-appearance order from
+            # factorize is already chronological
+            prepared['daily'] = _fast_group_sum(dengue_data['Date'], dengue_data['Cases'])
+
+            city_totals = _fast_group_sum(dengue_data['City'], dengue_data['Cases'])
+            prepared['city_totals'] = city_totals
+            # nlargest avoids the full sort_values().head(10) pass
+            prepared['by_city'] = city_totals.nlargest(10)
+
+        return prepared
+
+    def _get_prepared(self, dengue_data):
+        """Return the shared aggregations, cached until the CSV changes"""
+        cached = self._data_cache.get(self.dengue_cases_file)
+        cache_key = cached[0] if cached is not None else None
+
+        if (cache_key is not None and self._prepared_cache is not None
+                and self._prepared_cache[0] == cache_key):
+            return self._prepared_cache[1]
+
+        prepared = self._prepare(dengue_data)
+        if cache_key is not None:
+            self._prepared_cache = (cache_key, prepared)
+        return prepared
+
+    def _reusable_figure(self, name, figsize):
+        """Lazily create, then clear and reuse, one Figure per chart type"""
+        fig = self._figures.get(name)
+        if fig is None:
+            fig = Figure(figsize=figsize)
+            self._figures[name] = fig
+        fig.clear()
+        return fig
+
+    def _encode_figure(self, fig):
+        """Render a figure to a base64 string for the data-URI <img> templates"""
+        if self._fmt not in ('png', 'jpeg'):
             buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close(fig)
+            fig.savefig(buffer, format=self._fmt, dpi=self._dpi, bbox_inches='tight', facecolor='white')
+            return _b64encode(buffer.getbuffer()).decode('ascii')
+
+        # Draw once on the Agg canvas and hand the raw buffer to Pillow;
+        # savefig with bbox_inches='tight' renders the whole figure twice
+        # just to measure the crop box. The charts call fig.tight_layout()
+        # themselves, so the fixed canvas size is already well-framed.
+        fig.set_dpi(self._dpi)
+        fig.set_facecolor('white')
+        canvas = FigureCanvasAgg(fig)
+        canvas.draw()
+        # The plots are opaque white, so the alpha channel is dead weight;
+        # encoding RGB drops a quarter of the pixel bytes fed to zlib/base64
+        rgb = np.asarray(canvas.buffer_rgba())[..., :3]
+        img = Image.fromarray(rgb, 'RGB')
+
+        buffer = io.BytesIO()
+        if self._fmt == 'jpeg':
+            img.save(buffer, 'JPEG', quality=85, optimize=False)
+        else:
+            # zlib level 3 encodes these flat-colour plots ~4x faster than
+            # the default level 6 for a negligible size difference
+            img.save(buffer, 'PNG', compress_level=3, optimize=False)
+        # getbuffer() hands b64encode a zero-copy view; getvalue() would
+        # duplicate the whole PNG first
+        return _b64encode(buffer.getbuffer()).decode('ascii')
+
+    def _placeholder_chart(self, title, message):
+        """Render (once) and cache the 'no data' image for a chart"""
+        cached = self._placeholder_cache.get(title)
+        if cached is None:
+            fig = Figure(figsize=(12, 6))
+            ax = fig.add_subplot(111)
+            ax.text(0.5, 0.5, message,
+                   horizontalalignment='center', verticalalignment='center',
+                   fontsize=14, transform=ax.transAxes, color='#ef4444')
+            ax.set_title(title, fontsize=16, fontweight='bold')
+            cached = self._encode_figure(fig)
+            self._placeholder_cache[title] = cached
+        return cached
+
+    def create_time_series_chart(self, daily_cases):
+        """Create time series chart of dengue cases from pre-aggregated daily sums"""
+        try:
+            # Bail out to the cached placeholder before any Figure work
+            if daily_cases is None or len(daily_cases) == 0:
+                logger.debug("No valid dengue data for time series chart")
+                return self._placeholder_chart('Dengue Cases Over Time',
+                                               'No dengue cases data available\nPlease check data files')
+
+            fig = self._reusable_figure('time_series', (12, 6))
+            ax = fig.add_subplot(111)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Daily cases data: %d points", len(daily_cases))
+                logger.debug("Date range: %s to %s",
+                             daily_cases.index.min(), daily_cases.index.max())
+
+            # Per-point markers dominate render time on dense series and
+            # are indistinguishable anyway; draw a plain line past 2000
+            marker = 'o' if len(daily_cases) <= 2000 else None
+
+            # Create the plot with vibrant colors
+            ax.plot(daily_cases.index, daily_cases.values,
+                   marker=marker, linewidth=3, markersize=6, color='#dc2626', markerfacecolor='#ef4444')
+            ax.fill_between(daily_cases.index, daily_cases.values,
+                          alpha=0.4, color='#ef4444')
             
-            return image_base64
+            ax.set_title('Dengue Cases Over Time', fontsize=16, fontweight='bold', color='#1f2937')
+            ax.text(0.5, 0.95, 'Across 12 Karnataka Cities', transform=ax.transAxes, 
+                   ha='center', fontsize=10, style='italic', color='#6b7280')
+            ax.set_xlabel('Date', fontsize=12, fontweight='600')
+            ax.set_ylabel('Number of Cases', fontsize=12, fontweight='600')
+            # Format x-axis
+            ax.tick_params(axis='x', rotation=45)
+            fig.tight_layout()
+
+            # Convert to base64
+            return self._encode_figure(fig)
         except Exception as e:
-            logging.error(f"Time series chart error: {str(e)}")
-            print(f"Time series chart error: {str(e)}")
+            logger.error(f"Time series chart error: {str(e)}")
             return None
     
-    def create_location_chart(self, dengue_data):
-        """Create bar chart of cases by location"""
+    def create_location_chart(self, location_cases):
+        """Create bar chart of cases by location from pre-aggregated city sums"""
         try:
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            print(f"Creating location chart with {len(dengue_data)} rows")
-            
-            if not dengue_data.empty and 'City' in dengue_data.columns and 'Cases' in dengue_data.columns:
-                # Group by city and sum cases
-                location_cases = dengue_data.groupby('City')['Cases'].sum().sort_values(ascending=False).head(10)
-                
-                print(f"Location cases data: {location_cases.to_dict()}")
-                
-                # Create colorful bars
-                colors = ['#dc2626', '#ea580c', '#f59e0b', '#eab308', '#84cc16', 
-                         '#22c55e', '#10b981', '#14b8a6', '#06b6d4', '#0ea5e9']
-                
-                try:
-                    bars = ax.bar(range(len(location_cases)), location_cases.values, 
-                                color=colors[:len(location_cases)], alpha=0.8, edgecolor='white', linewidth=2)
-                    
-                    # Add value labels on bars
-                    max_value = float(max(location_cases.values))
-                    for i, bar in enumerate(bars):
-                        height = float(bar.get_height())
-                        x_pos = float(bar.get_x() + bar.get_width()/2.0)
-                        y_pos = height + max_value * 0.01
-                        ax.text(x_pos, y_pos, f'{int(height)}', 
-                               ha='center', va='bottom', fontsize=11, fontweight='bold')
-                except Exception as bar_error:
-                    print(f"Bar chart error: {bar_error}")
-                    # Fallback to simple bars without labels
-                    ax.bar(range(len(location_cases)), location_cases.values, 
-                           color=colors[:len(location_cases)], alpha=0.8)
-                
-                ax.set_title('Cases by Location (Karnataka Cities)', fontsize=16, fontweight='bold', color='#1f2937')
-                ax.set_xlabel('City', fontsize=12, fontweight='600')
-                ax.set_ylabel('Number of Cases', fontsize=12, fontweight='600')
-                ax.set_xticks(range(len(location_cases)))
-                ax.set_xticklabels(location_cases.index, rotation=45, ha='right', fontweight='500')
-                ax.grid(True, alpha=0.3, axis='y', color='#6b7280')
-                
-                # Style the plot
-                ax.spines['top'].set_visible(False)
-                ax.spines['right'].set_visible(False)
-                ax.spines['left'].set_color('#6b7280')
-                ax.spines['bottom'].set_color('#6b7280')
-                
-                plt.tight_layout()
-            else:
-                print("No valid location data for chart")
-                ax.text(0.5, 0.5, 'No location data available\nPlease check data files', 
-                       horizontalalignment='center', verticalalignment='center',
-                       fontsize=14, transform=ax.transAxes, color='#ef4444')
-                ax.set_title('Cases by Location', fontsize=16, fontweight='bold')
-            
+            # Bail out to the cached placeholder before any Figure work
+            if location_cases is None or len(location_cases) == 0:
+                logger.debug("No valid location data for chart")
+                return self._placeholder_chart('Cases by Location',
+                                               'No location data available\nPlease check data files')
+
+            fig = self._reusable_figure('location', (12, 8))
+            ax = fig.add_subplot(111)
+
+            # to_dict() allocates even when the message is discarded, so
+            # gate it on the debug level
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Location cases data: %s", location_cases.to_dict())
+
+            # Create colorful bars
+            colors = list(_BAR_COLORS)
+
+            try:
+                bars = ax.bar(range(len(location_cases)), location_cases.values, 
+                            color=colors[:len(location_cases)], alpha=0.8, edgecolor='white', linewidth=2)
+
+                # bar_label places all value labels in one artist pass
+                # instead of a Python loop creating a Text per bar
+                ax.bar_label(bars, labels=[f'{int(v)}' for v in location_cases.values],
+                             padding=3, fontsize=11, fontweight='bold')
+            except Exception as bar_error:
+                logger.debug("Bar chart error: %s", bar_error)
+                # Fallback to simple bars without labels
+                ax.bar(range(len(location_cases)), location_cases.values, 
+                       color=colors[:len(location_cases)], alpha=0.8)
+
+            ax.set_title('Cases by Location (Karnataka Cities)', fontsize=16, fontweight='bold', color='#1f2937')
+            ax.set_xlabel('City', fontsize=12, fontweight='600')
+            ax.set_ylabel('Number of Cases', fontsize=12, fontweight='600')
+            ax.set_xticks(range(len(location_cases)))
+            ax.set_xticklabels(location_cases.index, rotation=45, ha='right', fontweight='500')
+            ax.grid(True, axis='y')
+
+            fig.tight_layout()
+
             # Convert to base64
+            return self._encode_figure(fig)
+        except Exception as e:
+            logger.error(f"Location chart error: {str(e)}")
+            return None
+
+    def create_location_chart_lite(self, location_cases):
+        """Draw the location bar chart directly with Pillow
+
+        The top-10 bar chart is simple enough that the full matplotlib
+        pipeline (axes, ticks, layout) is most of its render cost. For a
+        handful of bars, rectangles and text on a Pillow canvas produce a
+        near-identical image in a fraction of the time. Enabled via
+        VIZ_LITE; only used for small series (no gridlines, no fancy
+        tick handling).
+        """
+        try:
+            if location_cases is None or len(location_cases) == 0:
+                return self._placeholder_chart('Cases by Location',
+                                               'No location data available\nPlease check data files')
+
+            width, height = 1200, 800
+            left, right, top, bottom = 80, 40, 80, 120
+            plot_w = width - left - right
+            plot_h = height - top - bottom
+
+            img = Image.new('RGB', (width, height), 'white')
+            draw = ImageDraw.Draw(img)
+            try:
+                title_font = ImageFont.truetype('DejaVuSans-Bold.ttf', 26)
+                label_font = ImageFont.truetype('DejaVuSans.ttf', 18)
+            except OSError:
+                title_font = label_font = ImageFont.load_default()
+
+            draw.text((width / 2, top / 2), 'Cases by Location (Karnataka Cities)',
+                      fill='#1f2937', font=title_font, anchor='mm')
+
+            values = [int(v) for v in location_cases.values]
+            max_value = max(values) or 1
+            n = len(values)
+            slot = plot_w / n
+            bar_w = slot * 0.7
+
+            for i, (name, value) in enumerate(zip(location_cases.index, values)):
+                bar_h = plot_h * value / max_value
+                x0 = left + i * slot + (slot - bar_w) / 2
+                y1 = top + plot_h
+                y0 = y1 - bar_h
+                draw.rectangle([x0, y0, x0 + bar_w, y1],
+                               fill=_BAR_COLORS[i % len(_BAR_COLORS)], outline='white', width=2)
+                draw.text((x0 + bar_w / 2, y0 - 6), str(value),
+                          fill='#1f2937', font=label_font, anchor='ms')
+                draw.text((x0 + bar_w / 2, y1 + 10), str(name),
+                          fill='#1f2937', font=label_font, anchor='ma')
+
             buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-            buffer.seek(0)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode()
-            plt.close(fig)
-            
-            return image_base64
+            img.save(buffer, 'PNG', compress_level=3, optimize=False)
+            return _b64encode(buffer.getbuffer()).decode('ascii')
         except Exception as e:
-            logging.error(f"Location chart error: {str(e)}")
-            print(f"Location chart error: {str(e)}")
+            logger.error(f"Lite location chart error: {str(e)}")
             return None
 
-    
     def generate_charts(self):
         """Generate all visualization charts"""
         try:
-            print("Starting chart generation...")
+            logger.debug("Starting chart generation...")
             dengue_data = self.load_data()
-            
-            print(f"Loaded data - Dengue: {len(dengue_data)} rows")
-            
+
+            logger.debug("Loaded data - Dengue: %d rows", len(dengue_data))
+
+            # Serve the previously rendered charts while the CSV is unchanged
+            cached = self._data_cache.get(self.dengue_cases_file)
+            cache_key = cached[0] if cached is not None else None
+            if (cache_key is not None and self._chart_cache is not None
+                    and self._chart_cache[0] == cache_key):
+                return self._chart_cache[1]
+
+            # Aggregate once; every chart and the statistics reuse the result
+            prepared = self._get_prepared(dengue_data)
+
             charts = {}
             generated_count = 0
-            
-            # Generate time series chart
-            print("Generating time series chart...")
-            try:
-                charts['time_series'] = self.create_time_series_chart(dengue_data)
-                if charts['time_series']:
-                    generated_count += 1
-                    print("Time series chart: Generated successfully")
-                else:
-                    print("Time series chart: Failed to generate")
-            except Exception as e:
-                print(f"Time series chart error: {str(e)}")
-                charts['time_series'] = None
-            
-            # Generate location chart  
-            print("Generating location chart...")
-            try:
-                charts['location'] = self.create_location_chart(dengue_data)
-                if charts['location']:
-                    generated_count += 1
-                    print("Location chart: Generated successfully")
-                else:
-                    print("Location chart: Failed to generate")
-            except Exception as e:
-                print(f"Location chart error: {str(e)}")
-                charts['location'] = None
-            
-            print(f"Chart generation complete. Generated: {generated_count} out of 2 charts")
+
+            # Each chart renders on its own Figure and the Agg/zlib work
+            # releases the GIL, so the two renders overlap on multi-core
+            # hosts. Threads beat a process pool here: the reusable Figure
+            # instances aren't picklable, and shipping the aggregated data
+            # out plus megapixel buffers back would cost more than the
+            # render itself.
+            by_city = prepared['by_city']
+            location_renderer = self.create_location_chart
+            if self._lite and by_city is not None and len(by_city) <= 20:
+                location_renderer = self.create_location_chart_lite
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = {
+                    'time_series': executor.submit(self.create_time_series_chart, prepared['daily']),
+                    'location': executor.submit(location_renderer, by_city)
+                }
+                for name, future in futures.items():
+                    try:
+                        charts[name] = future.result()
+                        if charts[name]:
+                            generated_count += 1
+                            logger.debug("%s chart: Generated successfully", name)
+                        else:
+                            logger.debug("%s chart: Failed to generate", name)
+                    except Exception as e:
+                        logger.error("%s chart error: %s", name, str(e))
+                        charts[name] = None
+
+            logger.debug("Chart generation complete. Generated: %d out of 2 charts", generated_count)
             
             # Add statistics data
-            charts['statistics'] = self.get_statistics(dengue_data)
-            
+            charts['statistics'] = self.get_statistics(dengue_data, prepared['city_totals'])
+            charts['image_mime'] = self.image_mime
+
+            if cache_key is not None:
+                self._chart_cache = (cache_key, charts)
+
             return charts
         except Exception as e:
-            logging.error(f"Chart generation error: {str(e)}")
-            print(f"Chart generation error: {str(e)}")
+            logger.error(f"Chart generation error: {str(e)}")
             return {'time_series': None, 'location': None, 'statistics': None}
     
     def get_map_data(self):
@@ -224,53 +520,35 @@ class Visualizer:
         try:
             dengue_data = self.load_data()
             
-            # Karnataka cities with coordinates (all 12 cities from our dataset)
-            karnataka_cities = {
-                'Bangalore': [12.9716, 77.5946],
-                'Mysore': [12.2958, 76.6394],
-                'Hubli': [15.3647, 75.1240],
-                'Mangalore': [12.9141, 74.8560],
-                'Belgaum': [15.8497, 74.4977],
-                'Tumkur': [13.3379, 77.1022],
-                'Davangere': [14.4644, 75.9218],
-                'Bellary': [15.1394, 76.9214],
-                'Bijapur': [16.8302, 75.7100],
-                'Shimoga': [13.9299, 75.5681],
-                'Gulbarga': [17.3297, 76.8343],
-                'Hassan': [13.0033, 76.1004]
-            }
-            
-            location_data = []
-            
-            # Get case data if available
+            # Get case data from the shared (cached) aggregation
+            prepared = self._get_prepared(dengue_data)
             case_data = {}
-            if not dengue_data.empty and 'City' in dengue_data.columns and 'Cases' in dengue_data.columns:
-                case_summary = dengue_data.groupby('City')['Cases'].sum()
-                case_data = case_summary.to_dict()
-                print(f"Case data loaded: {case_data}")
-            
-            # Create markers for ALL Karnataka cities
-            for city, coordinates in karnataka_cities.items():
-                cases = case_data.get(city, 0)  # Default to 0 if no cases found
-                
-                location_data.append({
+            if prepared['city_totals'] is not None:
+                case_data = prepared['city_totals'].to_dict()
+                logger.debug("Case data loaded: %s", case_data)
+
+            # Join cases onto ALL Karnataka cities in one pass
+            location_data = [
+                {
                     'name': city,
-                    'cases': int(cases),
-                    'lat': coordinates[0],
-                    'lng': coordinates[1],
+                    'cases': int(case_data.get(city, 0)),
+                    'lat': lat,
+                    'lng': lng,
                     'state': 'Karnataka'
-                })
-            
+                }
+                for city, lat, lng in _KARNATAKA_CITIES
+            ]
+
             return {
                 'locations': location_data,
                 'message': f'Showing {len(location_data)} locations with dengue cases'
             }
             
         except Exception as e:
-            logging.error(f"Map data error: {str(e)}")
+            logger.error(f"Map data error: {str(e)}")
             return {'locations': [], 'message': 'Error loading map data'}
     
-    def get_statistics(self, dengue_data):
+    def get_statistics(self, dengue_data, city_totals=None):
         """Get statistical summary of the data"""
         try:
             if dengue_data.empty:
@@ -282,26 +560,24 @@ class Visualizer:
                     'highest_risk_city': 'N/A'
                 }
             
-            total_cases = int(dengue_data['Cases'].sum()) if 'Cases' in dengue_data.columns else 0
-            total_cities = len(dengue_data['City'].unique()) if 'City' in dengue_data.columns else 0
-            
+            # Schema is validated in load_data, so the columns are safe to use
+            total_cases = int(dengue_data['Cases'].sum())
+            total_cities = len(dengue_data['City'].unique())
+
             # Date range
-            if 'Date' in dengue_data.columns:
-                min_date = dengue_data['Date'].min()
-                max_date = dengue_data['Date'].max()
-                date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
-                
-                # Average daily cases
-                date_range_days = (max_date - min_date).days + 1
-                avg_daily_cases = round(total_cases / max(date_range_days, 1), 1)
-            else:
-                date_range = 'Date information not available'
-                avg_daily_cases = 0
-            
-            # Highest risk city
-            if 'City' in dengue_data.columns and 'Cases' in dengue_data.columns:
-                city_totals = dengue_data.groupby('City')['Cases'].sum()
-                highest_risk_city = city_totals.idxmax() if not city_totals.empty else 'N/A'
+            min_date = dengue_data['Date'].min()
+            max_date = dengue_data['Date'].max()
+            date_range = f"{min_date.strftime('%Y-%m-%d')} to {max_date.strftime('%Y-%m-%d')}"
+
+            # Average daily cases
+            date_range_days = (max_date - min_date).days + 1
+            avg_daily_cases = round(total_cases / max(date_range_days, 1), 1)
+
+            # Highest risk city (reuse the shared aggregation when provided)
+            if city_totals is None:
+                city_totals = dengue_data.groupby('City', observed=True, sort=False)['Cases'].sum()
+            if city_totals is not None and not city_totals.empty:
+                highest_risk_city = city_totals.idxmax()
             else:
                 highest_risk_city = 'N/A'
             
@@ -313,7 +589,7 @@ class Visualizer:
                 'highest_risk_city': highest_risk_city
             }
         except Exception as e:
-            logging.error(f"Statistics calculation error: {str(e)}")
+            logger.error(f"Statistics calculation error: {str(e)}")
             return {
                 'total_cases': 0,
                 'total_cities': 0,
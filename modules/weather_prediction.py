@@ -1,18 +1,207 @@
+import asyncio
+import functools
 import os
+import random
+import time
+
+try:
+    # ~3x faster than the stdlib parser; not much against a network round
+    # trip, but the cache and keep-alive work make parsing a visible slice
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from datetime import datetime
-import pandas as pd
+from threading import Lock
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from .location_validator import KarnatakaLocationValidator
 
+try:
+    # Optional: JIT-compiles the bulk scoring kernel; the NumPy fallback
+    # below is used when numba is not installed
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _count_kernel_py(temps, hums, rains, out):
+    for i in range(temps.shape[0]):
+        n = 0
+        if 25.0 <= temps[i] <= 30.0:
+            n += 1
+        if hums[i] > 70.0:
+            n += 1
+        if rains[i] > 10.0:
+            n += 1
+        out[i] = n
+
+
+_count_kernel = njit(cache=True)(_count_kernel_py) if njit is not None else None
+
+
+def score_factor_counts(temps, hums, rains):
+    """Count active weather risk factors (0-3) for each row
+
+    Single-pass scorer for large arrays - e.g. weeks of historical
+    observations - where the JIT-compiled loop avoids allocating the
+    three boolean masks the NumPy expression needs. With numba absent it
+    falls back to the vectorized expression, so results are identical
+    either way. Risk levels map from the counts as 0 -> Low,
+    1 -> Moderate, >=2 -> High.
+    """
+    temps = np.ascontiguousarray(temps, dtype=np.float32)
+    hums = np.ascontiguousarray(hums, dtype=np.float32)
+    rains = np.ascontiguousarray(rains, dtype=np.float32)
+    out = np.empty(temps.shape[0], dtype=np.int8)
+    if _count_kernel is not None:
+        _count_kernel(temps, hums, rains, out)
+    else:
+        out[:] = (((temps >= 25) & (temps <= 30)).astype(np.int8)
+                  + (hums > 70) + (rains > 10))
+    return out
+
+# Static response parts per overall risk level, built once at import so
+# every prediction splices the same immutable structures instead of
+# rebuilding the lists on each call
+_RISK_LEVELS = {
+    'High': {
+        'risk_color': 'danger',
+        'alert_message': "⚠️ HIGH DENGUE RISK - Multiple favorable conditions for mosquito breeding detected!",
+        'recommendations': (
+            "🚨 Remove all stagnant water sources immediately",
+            "🦟 Use mosquito repellents and nets consistently",
+            "👕 Wear long-sleeved clothing, especially during dawn and dusk",
+            "🏥 Seek medical attention immediately if fever develops",
+            "🏘️ Alert neighbors and community about high risk conditions",
+        )
+    },
+    'Moderate': {
+        'risk_color': 'warning',
+        'alert_message': "⚠️ MODERATE DENGUE RISK - Some conditions favor mosquito activity",
+        'recommendations': (
+            "🔍 Check for and remove stagnant water weekly",
+            "🦟 Use mosquito repellents during peak mosquito hours",
+            "🏠 Keep surroundings clean and well-ventilated",
+            "🌡️ Monitor for dengue symptoms (fever, headache, body pain)",
+            "💡 Maintain awareness of local dengue alerts",
+        )
+    },
+    'Low': {
+        'risk_color': 'success',
+        'alert_message': "✅ LOW DENGUE RISK - Weather conditions not optimal for mosquito breeding",
+        'recommendations': (
+            "✅ Continue regular dengue prevention measures",
+            "🧹 Maintain clean surroundings",
+            "👀 Stay alert for weather changes",
+            "📰 Keep updated with local health advisories",
+        )
+    },
+}
+
+# Fallback mock values for typical Karnataka weather, shared by every
+# instance, with a lowercased-name index so lookup is one dict probe
+# instead of a linear scan with per-entry .lower() calls
+_MOCK_DATA = {
+    'Bangalore': {'temp': 26, 'humidity': 75, 'rainfall': 5},
+    'Mysore': {'temp': 25, 'humidity': 80, 'rainfall': 8},
+    'Hubli': {'temp': 28, 'humidity': 70, 'rainfall': 3},
+    'Mangalore': {'temp': 29, 'humidity': 85, 'rainfall': 12},
+    'Belgaum': {'temp': 25, 'humidity': 83, 'rainfall': 10}
+}
+_MOCK_DATA_LC = {k.lower(): k for k in _MOCK_DATA}
+
+@functools.lru_cache(maxsize=1)
+def _load_env_once():
+    """Parse the local .env file once per process
+
+    Predictors may be constructed per request; caching the parse keeps
+    repeated construction from re-reading and re-scanning the file.
+    """
+    env = {}
+    try:
+        if os.path.exists('.env'):
+            with open('.env', 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#') and '=' in line:
+                        key, value = line.split('=', 1)
+                        env[key.strip()] = value.strip()
+    except Exception as e:
+        logging.warning(f"Could not read .env file: {e}")
+    return env
+
 class WeatherPredictor:
-    def __init__(self):
+    def __init__(self, weather_ttl=600, stale_fallback=True, mock_seed=None):
         # Try to load from environment variable or config file
         self.api_key = self._load_api_key()
         self.base_url = "http://api.openweathermap.org/data/2.5/weather"
         
+        # Pooled session keeps the TCP connection to OpenWeatherMap alive
+        # across calls instead of paying a fresh handshake per request;
+        # the adapter retries transient failures and rate limits with
+        # exponential backoff before we fall back to mock data
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Recent API responses per city; weather doesn't change at second
+        # granularity, so a short TTL removes most repeat round trips.
+        # TTLCache evicts expired entries itself (the plain dict it
+        # replaces grew forever); the lock keeps it safe under the
+        # thread pool in predict_risks. Tests can pass weather_ttl=0
+        # to disable caching.
+        self._weather_cache = TTLCache(maxsize=64, ttl=weather_ttl)
+        self._cache_lock = Lock()
+
+        # Last good API response per city, kept past TTL expiry: during
+        # outages or rate-limit bursts serving slightly old real data
+        # beats dropping to synthetic mock values
+        self.stale_fallback = stale_fallback
+        self._stale_cache = {}
+
+        # Complete predict_risk results per city, valid within one 15-min
+        # bucket; bursts of identical dashboard requests share one result
+        self._risk_cache = {}
+        self._risk_bucket = None
+
+        # Formatted wall-clock string, rebuilt at most once per second
+        self._ts_cached = 0
+        self._ts_str = ''
+
+        # Validator verdicts per lowercased input; the app only ever sees
+        # a bounded set of city names, so the fuzzy matching runs once per
+        # distinct spelling
+        self._validate_cache = {}
+
+        # httpx client for the async API, created on first use
+        self._httpx_client = None
+
+        # Latest weather_history.csv record per city, built once on the
+        # first mock call and reused; loading lazily keeps pandas (and the
+        # CSV parse) off the live-API path entirely
+        self._mock_latest = None
+
+        # Dedicated RNG for the mock jitter; seedable so demo runs can be
+        # made reproducible
+        self._rng = random.Random(mock_seed)
+
         # Initialize Karnataka location validator
         self.location_validator = KarnatakaLocationValidator()
+
+        # Static part of the invalid-location response, joined once here
+        # instead of re-slicing and re-joining the city list per rejection
+        self._available_cities_blurb = ', '.join(
+            self.location_validator.get_karnataka_cities_list()[:6]) + '...'
         
         # Check if API key is properly configured
         if self.api_key in ['demo_key', 'your_actual_api_key_here', None]:
@@ -24,20 +213,9 @@ class WeatherPredictor:
         api_key = os.getenv('OPENWEATHER_API_KEY')
         if api_key:
             return api_key
-            
-        # Try to read from .env file
-        try:
-            env_path = '.env'
-            if os.path.exists(env_path):
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        if line.startswith('OPENWEATHER_API_KEY='):
-                            return line.split('=', 1)[1].strip()
-        except Exception as e:
-            logging.warning(f"Could not read .env file: {e}")
-        
-        # Default fallback
-        return 'demo_key'
+
+        # Fall back to the cached .env parse, then to the demo default
+        return _load_env_once().get('OPENWEATHER_API_KEY', 'demo_key')
         
     def get_weather_data(self, city):
         """Fetch current weather data from OpenWeatherMap API or use mock data"""
@@ -45,92 +223,251 @@ class WeatherPredictor:
             # If API key is not properly configured, use mock data
             if self.api_key == 'demo_key' or self.api_key == 'your_actual_api_key_here':
                 return self.get_mock_weather_data(city)
-            
+
+            cache_key = city.lower().strip()
+            with self._cache_lock:
+                cached = self._weather_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             params = {
                 'q': city,
                 'appid': self.api_key,
                 'units': 'metric'
             }
-            
-            response = requests.get(self.base_url, params=params, timeout=10)
-            
-            if response.status_code == 401:
-                logging.warning("Invalid API key. Using mock data instead.")
-                return self.get_mock_weather_data(city)
-            elif response.status_code == 404:
-                raise Exception(f"City '{city}' not found. Please check the city name.")
-            elif response.status_code != 200:
-                logging.warning(f"Weather API error: {response.status_code}. Using mock data.")
-                return self.get_mock_weather_data(city)
-            
-            data = response.json()
-            
-            # Get rainfall data if available (from recent weather)
-            rainfall = 0
-            if 'rain' in data:
-                rainfall = data['rain'].get('1h', 0)  # 1-hour rainfall
-            
-            return {
-                'city': data['name'],
-                'country': data['sys']['country'],
-                'temperature': data['main']['temp'],
-                'humidity': data['main']['humidity'],
-                'pressure': data['main']['pressure'],
-                'description': data['weather'][0]['description'],
-                'feels_like': data['main']['feels_like'],
-                'temp_min': data['main']['temp_min'],
-                'temp_max': data['main']['temp_max'],
-                'rainfall': rainfall
-            }
+
+            # Separate connect/read timeouts: fail fast on an unreachable
+            # host without cutting short a slow-but-alive response
+            response = self.session.get(self.base_url, params=params, timeout=(3.05, 7))
+
+            # 200 is the overwhelmingly common outcome once the retry
+            # adapter has absorbed 429/5xx, so take the success path first.
+            # Parsing the raw bytes instead of response.json() uses the
+            # faster parser and skips requests' charset guessing.
+            if response.status_code == 200:
+                return self._store_weather(cache_key, _json_loads(response.content))
+
+            return self._handle_error_status(response.status_code, city)
         except requests.exceptions.Timeout:
-            logging.warning("Request timeout. Using mock data.")
-            return self.get_mock_weather_data(city)
+            logging.warning("Request timeout. Using fallback data.")
+            return self._stale_or_mock(city)
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Network error: {str(e)}. Using mock data.")
-            return self.get_mock_weather_data(city)
+            logging.warning(f"Network error: {str(e)}. Using fallback data.")
+            return self._stale_or_mock(city)
         except Exception as e:
-            logging.warning(f"Weather data error: {str(e)}. Using mock data.")
+            logging.warning(f"Weather data error: {str(e)}. Using fallback data.")
             return self.get_mock_weather_data(city)
+
+    def _handle_error_status(self, status_code, city):
+        """Map a non-200 weather API status to the right fallback
+
+        Shared by the sync and async fetchers; 429/5xx normally never get
+        here because the adapter retries them first.
+        """
+        if status_code == 401:
+            logging.warning("Invalid API key. Using mock data instead.")
+            return self.get_mock_weather_data(city)
+        if status_code == 404:
+            raise Exception(f"City '{city}' not found. Please check the city name.")
+        logging.warning(f"Weather API error: {status_code}. Using fallback data.")
+        return self._stale_or_mock(city)
+
+    def _store_weather(self, cache_key, data):
+        """Build the weather dict from an API payload and cache it"""
+        # Get rainfall data if available (from recent weather)
+        rainfall = 0
+        if 'rain' in data:
+            rainfall = data['rain'].get('1h', 0)  # 1-hour rainfall
+
+        weather = {
+            'city': data['name'],
+            'country': data['sys']['country'],
+            'temperature': data['main']['temp'],
+            'humidity': data['main']['humidity'],
+            'pressure': data['main']['pressure'],
+            'description': data['weather'][0]['description'],
+            'feels_like': data['main']['feels_like'],
+            'temp_min': data['main']['temp_min'],
+            'temp_max': data['main']['temp_max'],
+            'rainfall': rainfall
+        }
+        with self._cache_lock:
+            self._weather_cache[cache_key] = weather
+            self._stale_cache[cache_key] = (time.time(), weather)
+        return weather
+
+    def _async_client(self):
+        """Lazily build the shared httpx client for the async API
+
+        httpx is an optional dependency; the sync requests path works
+        without it, so the import only happens when async fetching is
+        actually used.
+        """
+        if self._httpx_client is None:
+            try:
+                import httpx
+            except ImportError as e:
+                raise RuntimeError(
+                    "The async weather API requires the optional 'httpx' "
+                    "package (pip install httpx)") from e
+            self._httpx_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(7.0, connect=3.0))
+        return self._httpx_client
+
+    async def get_weather_data_async(self, city):
+        """Async variant of get_weather_data sharing its caches and fallbacks
+
+        All N requests of a bulk fetch multiplex over the client's
+        keep-alive pool without tying up a thread per city.
+        """
+        try:
+            if self.api_key == 'demo_key' or self.api_key == 'your_actual_api_key_here':
+                return self.get_mock_weather_data(city)
+
+            cache_key = city.lower().strip()
+            with self._cache_lock:
+                cached = self._weather_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            params = {
+                'q': city,
+                'appid': self.api_key,
+                'units': 'metric'
+            }
+
+            client = self._async_client()
+            response = await client.get(self.base_url, params=params)
+
+            if response.status_code == 200:
+                return self._store_weather(cache_key, _json_loads(response.content))
+
+            return self._handle_error_status(response.status_code, city)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logging.warning(f"Async weather data error: {str(e)}. Using fallback data.")
+            return self._stale_or_mock(city)
+
+    async def predict_risk_bulk_async(self, cities):
+        """Async counterpart of predict_risk_bulk using gathered fetches"""
+        cities = list(cities)
+        if not cities:
+            return []
+
+        weather = await asyncio.gather(
+            *(self.get_weather_data_async(city) for city in cities))
+        return self._summarize_bulk(weather)
+
+    def _stale_or_mock(self, city):
+        """Serve the last good API response for a city, else mock data
+
+        Used when the live call fails: an expired-but-real observation is
+        closer to the truth than the synthetic fallback, so it is returned
+        tagged with 'stale' and its age for callers that care.
+        """
+        if self.stale_fallback:
+            with self._cache_lock:
+                entry = self._stale_cache.get(city.lower().strip())
+            if entry is not None:
+                stored_ts, weather = entry
+                stale = dict(weather)
+                stale['stale'] = True
+                stale['stale_age_s'] = round(time.time() - stored_ts, 1)
+                return stale
+        return self.get_mock_weather_data(city)
     
+    def _load_mock_history(self):
+        """Index the latest weather_history.csv record per city, once
+
+        The CSV used to be re-read and re-filtered on every mock call;
+        one parse followed by dict lookups serves every later request.
+        """
+        if self._mock_latest is not None:
+            return self._mock_latest
+
+        latest = {}
+        weather_file = 'datasets/weather_history.csv'
+        try:
+            # Imported here so the common live-API path never pays the
+            # pandas startup cost
+            import pandas as pd
+        except ImportError:
+            pd = None
+        try:
+            if os.path.exists(weather_file):
+                if pd is not None:
+                    df = self._read_weather_history(pd, weather_file)
+                    df['_city_lc'] = df['City'].str.lower()
+                    latest = {k: g.iloc[-1].to_dict() for k, g in df.groupby('_city_lc')}
+                else:
+                    # Minimal installs without pandas still get real mock
+                    # data: one DictReader pass keeps the last row per
+                    # city, and float() below handles the string values
+                    import csv
+                    with open(weather_file, newline='') as f:
+                        for row in csv.DictReader(f):
+                            latest[row['City'].lower()] = row
+        except Exception as e:
+            logging.error(f"Error reading local weather data: {str(e)}")
+
+        self._mock_latest = latest
+        return latest
+
+    @staticmethod
+    def _read_weather_history(pd, weather_file):
+        """Read the weather history, preferring a Parquet sidecar
+
+        Same scheme as the dengue dataset in the visualizer: Parquet skips
+        text parsing and reads only the columns the mock data needs, and
+        the sidecar is rebuilt whenever the CSV is newer. Falls back to
+        plain CSV when pyarrow is unavailable.
+        """
+        columns = ['City', 'Temperature(C)', 'Humidity(%)', 'Rainfall(mm)']
+        parquet_file = weather_file + '.parquet'
+        try:
+            if (os.path.exists(parquet_file)
+                    and os.path.getmtime(parquet_file) >= os.path.getmtime(weather_file)):
+                return pd.read_parquet(parquet_file, columns=columns)
+        except Exception as e:
+            logging.warning(f"Parquet cache read failed, using CSV: {str(e)}")
+
+        df = pd.read_csv(weather_file, usecols=columns)
+        try:
+            df.to_parquet(parquet_file)
+        except Exception as e:
+            # pyarrow not installed or read-only filesystem - CSV still works
+            logging.warning(f"Could not write Parquet cache: {str(e)}")
+        return df
+
     def get_mock_weather_data(self, city):
         """Provide mock weather data when API is not available"""
         # Use data from your weather_history.csv for realistic mock data
+        city_lc = city.lower().strip()
         try:
-            import random
-            weather_file = 'datasets/weather_history.csv'
-            if os.path.exists(weather_file):
-                df = pd.read_csv(weather_file)
-                city_data = df[df['City'].str.lower() == city.lower()]
-                
-                if not city_data.empty:
-                    # Use the latest record for this city
-                    latest = city_data.iloc[-1]
-                    return {
-                        'city': latest['City'],
-                        'country': 'IN',
-                        'temperature': float(latest['Temperature(C)']),
-                        'humidity': float(latest['Humidity(%)']),
-                        'pressure': 1013.25,  # Standard pressure
-                        'description': 'partly cloudy',
-                        'feels_like': float(latest['Temperature(C)']) + random.uniform(-2, 3),
-                        'temp_min': float(latest['Temperature(C)']) - 2,
-                        'temp_max': float(latest['Temperature(C)']) + 3,
-                        'rainfall': float(latest['Rainfall(mm)'])
-                    }
+            latest = self._load_mock_history().get(city_lc)
+            if latest is not None:
+                # One conversion per field; the temperature feeds four keys
+                temp = float(latest['Temperature(C)'])
+                return {
+                    'city': latest['City'],
+                    'country': 'IN',
+                    'temperature': temp,
+                    'humidity': float(latest['Humidity(%)']),
+                    'pressure': 1013.25,  # Standard pressure
+                    'description': 'partly cloudy',
+                    'feels_like': temp + self._rng.uniform(-2, 3),
+                    'temp_min': temp - 2,
+                    'temp_max': temp + 3,
+                    'rainfall': float(latest['Rainfall(mm)'])
+                }
         except Exception as e:
-            logging.error(f"Error reading local weather data: {str(e)}")
+            logging.error(f"Error building mock weather data: {str(e)}")
         
         # Fallback mock data based on typical Bangalore weather
-        mock_data = {
-            'Bangalore': {'temp': 26, 'humidity': 75, 'rainfall': 5},
-            'Mysore': {'temp': 25, 'humidity': 80, 'rainfall': 8},
-            'Hubli': {'temp': 28, 'humidity': 70, 'rainfall': 3},
-            'Mangalore': {'temp': 29, 'humidity': 85, 'rainfall': 12},
-            'Belgaum': {'temp': 25, 'humidity': 83, 'rainfall': 10}
-        }
-        
-        city_key = next((k for k in mock_data.keys() if k.lower() == city.lower()), 'Bangalore')
-        base_data = mock_data[city_key]
+        city_key = _MOCK_DATA_LC.get(city_lc, 'Bangalore')
+        base_data = _MOCK_DATA[city_key]
         
         return {
             'city': city.title(),
@@ -145,11 +482,127 @@ class WeatherPredictor:
             'rainfall': base_data['rainfall']
         }
     
+    def predict_risks(self, cities):
+        """Predict dengue risk for several cities in one batch
+
+        The per-city weather fetches are independent and I/O bound, so a
+        dashboard asking for all Karnataka cities waits roughly one round
+        trip instead of one per city.
+        """
+        cities = list(cities)
+        if not cities:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(12, len(cities))) as executor:
+            return list(executor.map(self.predict_risk, cities))
+
+    def _now_str(self):
+        """Timestamp string for result payloads, cached per second
+
+        strftime costs tens of microseconds; within a bulk scoring pass
+        every result shares the same second anyway.
+        """
+        t = int(time.time())
+        if t != self._ts_cached:
+            self._ts_cached = t
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))
+        return self._ts_str
+
+    def _score_batch(self, temps, humidities, rainfalls):
+        """Score the three weather risk factors over parallel arrays
+
+        Boolean arithmetic applies the threshold rules (25-30C optimal
+        temperature, >70% humidity, >10mm rainfall) to every city at once,
+        so bulk scoring costs a few NumPy ops instead of a Python branch
+        chain per city. Returns the per-factor flags and the overall level.
+        """
+        temps = np.asarray(temps, dtype=np.float64)
+        humidities = np.asarray(humidities, dtype=np.float64)
+        rainfalls = np.asarray(rainfalls, dtype=np.float64)
+
+        temp_high = (temps >= 25) & (temps <= 30)
+        hum_high = humidities > 70
+        rain_high = rainfalls > 10
+
+        n_risk = temp_high.astype(np.int8) + hum_high + rain_high
+        overall = np.where(n_risk >= 2, 'High',
+                           np.where(n_risk == 1, 'Moderate', 'Low'))
+        return temp_high, hum_high, rain_high, overall
+
+    def predict_risk_bulk(self, cities):
+        """Score many cities in one vectorized pass
+
+        Fetches the weather for each city concurrently, then classifies
+        the whole batch with a single _score_batch call. Returns compact
+        per-city summaries for map/dashboard views; callers needing the
+        full explanation payload should use predict_risks instead.
+        """
+        cities = list(cities)
+        if not cities:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(12, len(cities))) as executor:
+            weather = list(executor.map(self.get_weather_data, cities))
+        return self._summarize_bulk(weather)
+
+    def _summarize_bulk(self, weather):
+        """Classify fetched weather dicts into compact per-city summaries"""
+        temp_high, hum_high, rain_high, overall = self._score_batch(
+            [w['temperature'] for w in weather],
+            [w['humidity'] for w in weather],
+            [w['rainfall'] for w in weather])
+
+        timestamp = self._now_str()
+        return [
+            {
+                'city': w['city'],
+                'risk_level': str(overall[i]),
+                'risk_color': _RISK_LEVELS[str(overall[i])]['risk_color'],
+                'temperature': w['temperature'],
+                'humidity': w['humidity'],
+                'rainfall': w['rainfall'],
+                'risk_factors': [name for name, flag in
+                                 (('temperature', temp_high[i]),
+                                  ('humidity', hum_high[i]),
+                                  ('rainfall', rain_high[i])) if flag],
+                'timestamp': timestamp
+            }
+            for i, w in enumerate(weather)
+        ]
+
     def predict_risk(self, city):
-        """Predict dengue risk based on weather conditions (Karnataka cities only)"""
+        """Predict dengue risk based on weather conditions (Karnataka cities only)
+
+        Results are cached per city for the current 15-minute bucket, so
+        repeated requests (dashboard re-renders, the 12-city batch) skip
+        the weather fetch and classification entirely; bucket rollover
+        invalidates the whole cache automatically.
+        """
+        bucket = int(time.time() // 900)
+        if bucket != self._risk_bucket:
+            self._risk_cache.clear()
+            self._risk_bucket = bucket
+
+        cache_key = city.strip().lower()
+        cached = self._risk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._predict_risk_uncached(city)
+        self._risk_cache[cache_key] = result
+        return result
+
+    def _predict_risk_uncached(self, city):
+        """Run the full validation + weather + classification pipeline"""
         try:
-            # Validate that the city is in Karnataka
-            is_valid, normalized_city, suggestions = self.location_validator.validate_and_normalize(city)
+            # Validate that the city is in Karnataka (memoized - repeat
+            # queries skip the validator's list scans and fuzzy matching)
+            validate_key = city.strip().lower()
+            verdict = self._validate_cache.get(validate_key)
+            if verdict is None:
+                verdict = self.location_validator.validate_and_normalize(city)
+                self._validate_cache[validate_key] = verdict
+            is_valid, normalized_city, suggestions = verdict
             
             if not is_valid:
                 logging.warning(f"Invalid Karnataka city: {city}")
@@ -163,12 +616,12 @@ class WeatherPredictor:
                     'rainfall': 0,
                     'risk_factors': [],
                     'recommendations': [
-                        f"📍 This system only provides weather-based dengue risk for Karnataka cities",
+                        "📍 This system only provides weather-based dengue risk for Karnataka cities",
                         f"🏠 Suggested Karnataka cities: {', '.join(suggestions)}" if suggestions else "🏠 Try cities like Bangalore, Mysore, Mangalore",
-                        f"📋 Available cities: {', '.join(self.location_validator.get_karnataka_cities_list()[:6])}...",
-                        f"🔍 Please enter a valid Karnataka city name"
+                        f"📋 Available cities: {self._available_cities_blurb}",
+                        "🔍 Please enter a valid Karnataka city name"
                     ],
-                    'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    'timestamp': self._now_str(),
                     'data_source': 'Karnataka weather data only',
                     'suggestions': suggestions
                 }
@@ -179,13 +632,17 @@ class WeatherPredictor:
             humidity = weather_data['humidity']
             rainfall = weather_data['rainfall']
             
-            # Rule-based dengue risk prediction with your specific thresholds
+            # Rule-based dengue risk prediction with your specific
+            # thresholds, evaluated by the shared vectorized scorer
+            temp_high, hum_high, rain_high, overall = self._score_batch(
+                [temperature], [humidity], [rainfall])
+
             risk_factors = []
             risk_explanations = []
             
             # Temperature: Optimal for dengue = 25°C to 30°C
             temp_risk = "Low"
-            if 25 <= temperature <= 30:
+            if temp_high[0]:
                 temp_risk = "High"
                 risk_factors.append("temperature")
                 risk_explanations.append(f"🌡️ Optimal temperature for dengue mosquito breeding: {temperature}°C (25-30°C range)")
@@ -197,7 +654,7 @@ class WeatherPredictor:
             
             # Humidity: > 70% increases risk
             humidity_risk = "Low"
-            if humidity > 70:
+            if hum_high[0]:
                 humidity_risk = "High"
                 risk_factors.append("humidity")
                 risk_explanations.append(f"💧 High humidity increases dengue risk: {humidity}% (>70% threshold)")
@@ -206,7 +663,7 @@ class WeatherPredictor:
             
             # Rainfall: More than 10mm = high breeding condition
             rainfall_risk = "Low"
-            if rainfall > 10:
+            if rain_high[0]:
                 rainfall_risk = "High"
                 risk_factors.append("rainfall")
                 risk_explanations.append(f"🌧️ High rainfall creates breeding sites: {rainfall}mm (>10mm threshold)")
@@ -215,57 +672,23 @@ class WeatherPredictor:
             else:
                 risk_explanations.append("🌧️ No recent rainfall detected")
             
-            # Determine overall risk level
-            high_risk_factors = len(risk_factors)
-            if high_risk_factors >= 2:
-                overall_risk = "High"
-                risk_color = "danger"
-                alert_message = "⚠️ HIGH DENGUE RISK - Multiple favorable conditions for mosquito breeding detected!"
-            elif high_risk_factors == 1:
-                overall_risk = "Moderate"
-                risk_color = "warning"  
-                alert_message = "⚠️ MODERATE DENGUE RISK - Some conditions favor mosquito activity"
-            else:
-                overall_risk = "Low"
-                risk_color = "success"
-                alert_message = "✅ LOW DENGUE RISK - Weather conditions not optimal for mosquito breeding"
-            
-            # Safety recommendations based on risk level
-            if overall_risk == "High":
-                recommendations = [
-                    "🚨 Remove all stagnant water sources immediately",
-                    "🦟 Use mosquito repellents and nets consistently", 
-                    "👕 Wear long-sleeved clothing, especially during dawn and dusk",
-                    "🏥 Seek medical attention immediately if fever develops",
-                    "🏘️ Alert neighbors and community about high risk conditions"
-                ]
-            elif overall_risk == "Moderate":
-                recommendations = [
-                    "🔍 Check for and remove stagnant water weekly",
-                    "🦟 Use mosquito repellents during peak mosquito hours",
-                    "🏠 Keep surroundings clean and well-ventilated",
-                    "🌡️ Monitor for dengue symptoms (fever, headache, body pain)",
-                    "💡 Maintain awareness of local dengue alerts"
-                ]
-            else:
-                recommendations = [
-                    "✅ Continue regular dengue prevention measures",
-                    "🧹 Maintain clean surroundings",
-                    "👀 Stay alert for weather changes",
-                    "📰 Keep updated with local health advisories"
-                ]
+            # Overall level comes from the shared vectorized scorer;
+            # colour, alert text and the safety recommendations from
+            # the shared tier table
+            overall_risk = str(overall[0])
+            level = _RISK_LEVELS[overall_risk]
             
             return {
                 'risk_level': overall_risk,
-                'risk_color': risk_color,
-                'alert_message': alert_message,
+                'risk_color': level['risk_color'],
+                'alert_message': level['alert_message'],
                 'weather_data': weather_data,
                 'risk_explanations': risk_explanations,
-                'recommendations': recommendations,
+                'recommendations': level['recommendations'],
                 'temperature_risk': temp_risk,
                 'humidity_risk': humidity_risk,
                 'rainfall_risk': rainfall_risk,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                'timestamp': self._now_str()
             }
             
         except Exception as e:
@@ -7,6 +7,7 @@ Run this to verify your OpenWeather API is working
 import os
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 def test_weather_api():
@@ -32,12 +33,24 @@ def test_weather_api():
     
     # Test cities
     test_cities = ['Bangalore', 'Mumbai', 'Chennai', 'Kolkata', 'Hyderabad']
-    
-    for city in test_cities:
+
+    # One session shared by all workers so connections are pooled; the
+    # per-city calls are independent, so the wall time is one round trip
+    # instead of five
+    session = requests.Session()
+
+    def fetch(city):
+        url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
+        return session.get(url, timeout=10)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(fetch, city) for city in test_cities]
+
+    # Report in the original city order regardless of completion order
+    for city, future in zip(test_cities, futures):
         try:
-            url = f"http://api.openweathermap.org/data/2.5/weather?q={city}&appid={api_key}&units=metric"
-            response = requests.get(url, timeout=10)
-            
+            response = future.result()
+
             if response.status_code == 200:
                 data = response.json()
                 temp = data['main']['temp']
@@ -76,12 +89,19 @@ def test_local_weather_module():
         
         # Test Karnataka cities
         karnataka_cities = ['Bangalore', 'Mysore', 'Hubli', 'Mangalore']
-        
-        for city in karnataka_cities:
+
+        def probe(city):
+            return predictor.get_weather_data(city), predictor.predict_risk(city)
+
+        # The predictor's session and caches are thread-safe, so probe the
+        # cities concurrently and print in order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(probe, city) for city in karnataka_cities]
+
+        for city, future in zip(karnataka_cities, futures):
             try:
-                weather_data = predictor.get_weather_data(city)
-                risk_result = predictor.predict_risk(city)
-                
+                weather_data, risk_result = future.result()
+
                 is_mock = 'mock data' in str(weather_data.get('description', '')).lower()
                 status = "🔴 MOCK DATA" if is_mock else "✅ LIVE DATA"
                 